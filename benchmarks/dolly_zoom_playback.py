@@ -0,0 +1,71 @@
+"""Compara o custo de playback do Dolly Zoom nos modos BAKE e DRIVER.
+
+Uso:
+    blender --background --factory-startup --python benchmarks/dolly_zoom_playback.py
+"""
+
+import os
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import quick_camera_moves
+
+DURATION = 10.0
+REPEATS = 5
+
+
+def setup_scene():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    scene = bpy.context.scene
+    scene.render.fps = 24
+    scene.frame_start = 1
+    scene.frame_current = 1
+
+    bpy.ops.object.camera_add(location=(0, -10, 2))
+    scene.camera = bpy.context.active_object
+
+    bpy.ops.mesh.primitive_cube_add(location=(0, 0, 1))
+    target = bpy.context.active_object
+
+    props = scene.qcm_props
+    props.target_object = target
+    props.move_type = 'DOLLY_ZOOM'
+    props.duration = DURATION
+    return scene
+
+
+def time_playback(scene):
+    frames = range(scene.frame_start, scene.frame_end + 1)
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for frame in frames:
+            scene.frame_set(frame)
+        best = min(best, time.perf_counter() - start)
+    return best / len(frames)
+
+
+def main():
+    quick_camera_moves.register()
+    try:
+        for mode in ('BAKE', 'DRIVER'):
+            scene = setup_scene()
+            scene.qcm_props.dolly_zoom_mode = mode
+
+            start = time.perf_counter()
+            bpy.ops.qcm.create_move()
+            create_time = time.perf_counter() - start
+
+            per_frame = time_playback(scene)
+            print(f"{mode:6s}  criação: {create_time * 1000:8.2f} ms  "
+                  f"playback: {per_frame * 1e6:8.1f} µs/frame")
+    finally:
+        quick_camera_moves.unregister()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+bl_info = {
+    "name": "Quick Camera Moves",
+    "author": "Victor",
+    "version": (2, 1, 0),
+    "blender": (4, 0, 0),
+    "location": "View3D > Sidebar > Camera Moves",
+    "description": "Cria movimentos cinematográficos de câmera com poucos cliques",
+    "category": "Animation",
+}
+
+import bpy
+from bpy.props import PointerProperty
+
+from .properties import QCM_Properties
+from .operators import QCM_OT_create_move, QCM_OT_clear_animation, QCM_OT_preview
+from .panel import QCM_PT_main_panel
+
+
+classes = (
+    QCM_Properties,
+    QCM_OT_create_move,
+    QCM_OT_clear_animation,
+    QCM_OT_preview,
+    QCM_PT_main_panel,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    bpy.types.Scene.qcm_props = PointerProperty(type=QCM_Properties)
+
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+    del bpy.types.Scene.qcm_props
@@ -0,0 +1,137 @@
+"""Registro dos tipos de movimento.
+
+Cada movimento é registrado só com metadados; o módulo gerador é importado
+na primeira vez que o movimento é criado. Plugins de estúdio podem registrar
+novos movimentos com `register_move` passando um módulo absoluto:
+
+    from quick_camera_moves import moves
+    moves.register_move('STUDIO_SWEEP', "Sweep", "Movimento do estúdio",
+                        "studio_moves.sweep", props=("move_distance",))
+
+O módulo precisa expor `generate(context, camera, target_obj, target_loc,
+start_frame, end_frame, props)`, que retorna um dict com cada data path que
+gravou e como o operador pode tratá-lo depois:
+
+- `EASE`: chaves comuns, recebem o easing e a rampa de velocidade;
+- `SAMPLED`: a interpolação já foi definida pelo gerador, só recebe a rampa;
+- `TIMED`: interpolação e tempo (inclusive a rampa) já definidos pelo gerador.
+
+Para o preview, o módulo pode expor a trajetória sem gravar chaves:
+
+- `path(camera, target_obj, target_loc, progress, props)`: array (N, 3) de
+  posições para cada progresso de 0 a 1; a câmera olha para o target. O
+  preview aplica o mesmo ease de duas chaves BEZIER; movimentos com mais
+  chaves devem gravar as amostras com `timing.bake_path`;
+- `trajectory(context, camera, target_obj, target_loc, start_frame, end_frame,
+  times, props)`: (posições, direções do olhar), para movimentos que giram a
+  câmera. `times` já vem com a rampa de velocidade aplicada. As posições
+  ficam no espaço local da câmera; retornar None desliga o preview.
+
+Movimentos sem nenhuma das duas não têm preview.
+"""
+
+import importlib
+import zlib
+from collections import namedtuple
+
+EASE = 'EASE'
+SAMPLED = 'SAMPLED'
+TIMED = 'TIMED'
+
+MoveInfo = namedtuple("MoveInfo", "identifier name description module function props easing apply_easing value")
+
+MOVES = {}
+
+_generators = {}
+_enum_items = None
+# Listas já entregues ao Blender; precisam continuar vivas enquanto ele usar as strings
+_enum_history = []
+
+
+def register_move(identifier, name, description, module, function="generate", props=(),
+                  easing=True, apply_easing=True, value=None):
+    """Registra um movimento; `module` relativo é resolvido dentro deste pacote.
+
+    `props` lista as propriedades mostradas no painel e `easing` indica se a
+    opção de easing aparece para o movimento. Com `apply_easing=False` o
+    operador não reaplica a interpolação depois de gerar o movimento.
+
+    `value` é o número salvo no .blend para o item do enum. Se omitido, vem de
+    um hash do identificador, então não muda com a ordem de registro.
+    """
+    global _enum_items
+    if value is None:
+        value = zlib.crc32(identifier.encode()) & 0x7FFFFFFF
+    MOVES[identifier] = MoveInfo(identifier, name, description, module, function,
+                                 tuple(props), easing, apply_easing, value)
+    _generators.pop(identifier, None)
+    _enum_items = None
+
+
+def unregister_move(identifier):
+    global _enum_items
+    MOVES.pop(identifier, None)
+    _generators.pop(identifier, None)
+    _enum_items = None
+
+
+def get_module(identifier):
+    return importlib.import_module(MOVES[identifier].module, __name__)
+
+
+def get_generator(identifier):
+    generator = _generators.get(identifier)
+    if generator is None:
+        info = MOVES[identifier]
+        generator = _generators[identifier] = getattr(get_module(identifier), info.function)
+    return generator
+
+
+def enum_items():
+    global _enum_items
+    if _enum_items is None:
+        _enum_items = [
+            (info.identifier, info.name, info.description, info.value)
+            for info in MOVES.values()
+        ]
+        _enum_history.append(_enum_items)
+    return _enum_items
+
+
+# Os movimentos embutidos mantêm os valores do enum estático original (0-17)
+register_move('ORBIT', "Orbit", "Gira ao redor do target", ".orbit",
+              props=("orbit_angle",), value=0)
+register_move('DOLLY_IN', "Dolly In", "Aproxima do target", ".dolly",
+              props=("move_distance",), value=1)
+register_move('DOLLY_OUT', "Dolly Out", "Afasta do target", ".dolly",
+              props=("move_distance",), value=2)
+register_move('TRUCK_LEFT', "Truck Left", "Move para esquerda", ".truck",
+              props=("move_distance",), value=3)
+register_move('TRUCK_RIGHT', "Truck Right", "Move para direita", ".truck",
+              props=("move_distance",), value=4)
+register_move('PEDESTAL_UP', "Pedestal Up", "Sobe a câmera", ".pedestal",
+              props=("move_distance",), value=5)
+register_move('PEDESTAL_DOWN', "Pedestal Down", "Desce a câmera", ".pedestal",
+              props=("move_distance",), value=6)
+register_move('CRANE', "Crane Shot", "Arco de cima para baixo", ".crane",
+              value=7)
+register_move('DOLLY_ZOOM', "Dolly Zoom (Vertigo)", "Efeito Hitchcock - fundo distorce", ".dolly_zoom",
+              props=("move_distance", "dolly_zoom_intensity", "dolly_zoom_mode"), value=8)
+register_move('ARC_SHOT', "Arc Shot", "Arco 3D ao redor do target", ".arc_shot",
+              props=("orbit_angle", "arc_height"), value=9)
+register_move('WHIP_PAN', "Whip Pan", "Rotação rápida horizontal", ".whip_pan",
+              props=("orbit_angle", "rotation_profile", "rotation_tolerance"), easing=False, value=10)
+register_move('PUSH_TILT', "Push In + Tilt", "Aproxima com rotação", ".push_tilt",
+              props=("move_distance", "tilt_angle", "tilt_profile", "rotation_tolerance"), value=11)
+register_move('TURNTABLE', "Turntable", "Rotação 360° perfeita", ".turntable",
+              props=("orbit_angle",), value=12)
+register_move('FLYTHROUGH', "Flythrough", "Atravessa a cena em linha reta", ".flythrough",
+              props=("move_distance",), value=13)
+register_move('ZOOM_IN', "Zoom In", "Aumenta FOV sem mover", ".zoom",
+              props=("zoom_fov_start", "zoom_fov_end"), easing=False, value=14)
+register_move('ZOOM_OUT', "Zoom Out", "Diminui FOV sem mover", ".zoom",
+              props=("zoom_fov_start", "zoom_fov_end"), easing=False, value=15)
+register_move('SHAKE', "Camera Shake", "Tremida de câmera na mão", ".shake",
+              props=("shake_intensity", "shake_frequency", "shake_seed"), easing=False, apply_easing=False, value=16)
+register_move('FOLLOW_PATH', "Follow Path", "Segue curva existente", ".follow_path",
+              value=17)
@@ -0,0 +1,34 @@
+import math
+
+import numpy as np
+from mathutils import Vector
+
+from . import SAMPLED
+from ..timing import bake_path
+from ..utils import add_track_constraint
+
+
+def path(camera, target_obj, target_loc, progress, props):
+    offset = camera.location - target_loc
+    # Raio horizontal, como no Orbit: o progresso 0 é a posição atual
+    radius = Vector((offset.x, offset.y, 0)).length
+    progress = np.asarray(progress, dtype=float)
+    angle = math.atan2(offset.y, offset.x) + props.orbit_angle * progress
+
+    return np.column_stack((
+        target_loc.x + radius * np.cos(angle),
+        target_loc.y + radius * np.sin(angle),
+        camera.location.z + props.arc_height * np.sin(progress * math.pi),
+    ))
+
+
+def generate(context, camera, target_obj, target_loc, start_frame, end_frame, props):
+    context.scene.frame_set(start_frame)
+    bake_path(camera, path, target_obj, target_loc, start_frame, end_frame, props)
+
+    if target_obj:
+        add_track_constraint(camera, target_obj=target_obj, start_frame=start_frame)
+    else:
+        add_track_constraint(camera, target_loc=target_loc, start_frame=start_frame)
+
+    return {"location": SAMPLED}
@@ -0,0 +1,44 @@
+import math
+
+import numpy as np
+from mathutils import Vector
+
+from . import SAMPLED
+from ..timing import bake_path
+from ..utils import add_track_constraint
+
+# O arco começa depois de 1/STEPS do movimento, vindo da posição atual
+STEPS = 8
+
+
+def path(camera, target_obj, target_loc, progress, props):
+    offset = camera.location - target_loc
+    radius = offset.length
+    direction_2d = Vector((offset.x, offset.y, 0)).normalized()
+
+    progress = np.asarray(progress, dtype=float)
+    angle = np.radians(90 * np.maximum(progress, 1 / STEPS))
+    horizontal_dist = radius * np.cos(math.radians(45) - angle * 0.5)
+    height = radius * np.sin(math.radians(90) - angle)
+
+    arc = np.column_stack((
+        target_loc.x + direction_2d.x * horizontal_dist,
+        target_loc.y + direction_2d.y * horizontal_dist,
+        target_loc.z + height,
+    ))
+
+    blend = np.clip(progress * STEPS, 0.0, 1.0)[:, np.newaxis]
+    start = np.array(camera.location)
+    return start + (arc - start) * blend
+
+
+def generate(context, camera, target_obj, target_loc, start_frame, end_frame, props):
+    context.scene.frame_set(start_frame)
+    bake_path(camera, path, target_obj, target_loc, start_frame, end_frame, props)
+
+    if target_obj:
+        add_track_constraint(camera, target_obj=target_obj, start_frame=start_frame)
+    else:
+        add_track_constraint(camera, target_loc=target_loc, start_frame=start_frame)
+
+    return {"location": SAMPLED}
@@ -0,0 +1,26 @@
+import numpy as np
+
+from . import EASE
+from ..utils import add_track_constraint, key_path
+
+
+def path(camera, target_obj, target_loc, progress, props):
+    direction = (target_loc - camera.location).normalized()
+
+    if props.move_type == 'DOLLY_OUT':
+        direction = -direction
+
+    progress = np.asarray(progress, dtype=float)
+    return np.array(camera.location) + np.outer(progress * props.move_distance, np.array(direction))
+
+
+def generate(context, camera, target_obj, target_loc, start_frame, end_frame, props):
+    context.scene.frame_set(start_frame)
+    key_path(camera, path, target_obj, target_loc, start_frame, end_frame, props)
+
+    if target_obj:
+        add_track_constraint(camera, target_obj=target_obj, start_frame=start_frame)
+    else:
+        add_track_constraint(camera, target_loc=target_loc, start_frame=start_frame)
+
+    return {"location": EASE}
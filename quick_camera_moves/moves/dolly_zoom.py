@@ -0,0 +1,100 @@
+import numpy as np
+from mathutils import Matrix
+
+from . import EASE, SAMPLED
+from ..timing import frame_samples, smoothstep
+from ..utils import LENS_DRIVER_VAR, add_track_constraint, remove_lens_driver, write_keyframes
+
+
+def add_dolly_zoom_driver(camera, target, initial_lens, initial_distance):
+    """Driver de expressão simples (sem função Python): lente proporcional à distância.
+
+    `initial_distance` precisa estar em espaço de mundo, como o LOC_DIFF.
+    """
+    cam_data = camera.data
+    remove_lens_driver(cam_data)
+
+    driver = cam_data.driver_add("lens").driver
+    driver.type = 'SCRIPTED'
+
+    var = driver.variables.new()
+    var.name = LENS_DRIVER_VAR
+    var.type = 'LOC_DIFF'
+    var.targets[0].id = camera
+    var.targets[1].id = target
+
+    driver.expression = f"max(1.0, {initial_lens / initial_distance:.9g} * {LENS_DRIVER_VAR})"
+
+
+def world_points(camera, target_obj, target_loc):
+    """Posição inicial da câmera e do target em espaço de mundo, como o LOC_DIFF do driver."""
+    start_world = camera.matrix_world.translation.copy()
+    target_world = target_obj.matrix_world.translation.copy() if target_obj else target_loc.copy()
+    return start_world, target_world
+
+
+def world_path(camera, target_obj, target_loc, progress, props):
+    start_world, target_world = world_points(camera, target_obj, target_loc)
+    direction = (target_world - start_world).normalized()
+    move_dist = props.move_distance * props.dolly_zoom_intensity
+
+    progress = np.asarray(progress, dtype=float)
+    return np.array(start_world) + np.outer(progress * move_dist, np.array(direction))
+
+
+def path(camera, target_obj, target_loc, progress, props):
+    """Trajetória no espaço local da câmera, o mesmo das chaves de localização."""
+    if camera.parent:
+        to_local = (camera.parent.matrix_world @ camera.matrix_parent_inverse).inverted()
+    else:
+        to_local = Matrix.Identity(4)
+
+    to_local = np.array(to_local)
+    world = world_path(camera, target_obj, target_loc, progress, props)
+    return world @ to_local[:3, :3].T + to_local[:3, 3]
+
+
+def generate(context, camera, target_obj, target_loc, start_frame, end_frame, props):
+    """Efeito Vertigo: move câmera enquanto ajusta FOV pra manter tamanho aparente do subject
+
+    Com o tamanho aparente constante, a lente é proporcional à distância:
+    lens = lens_inicial * distância / distância_inicial.
+    """
+    cam_data = camera.data
+
+    context.scene.frame_set(start_frame)
+
+    start_world, target_world = world_points(camera, target_obj, target_loc)
+    initial_distance = (start_world - target_world).length
+    initial_lens = cam_data.lens
+
+    if target_obj:
+        add_track_constraint(camera, target_obj=target_obj, start_frame=start_frame)
+        tracked = target_obj
+    else:
+        tracked = add_track_constraint(camera, target_loc=target_loc, start_frame=start_frame)
+
+    if props.dolly_zoom_mode == 'DRIVER':
+        positions = path(camera, target_obj, target_loc, (0.0, 1.0), props)
+        write_keyframes(camera, "location", [start_frame, end_frame], positions.tolist())
+
+        add_dolly_zoom_driver(camera, tracked, initial_lens, initial_distance)
+        return {"location": EASE}
+
+    remove_lens_driver(cam_data)
+
+    # Bake exato: posição e lente de todos os frames calculadas de uma vez
+    frames = np.array(frame_samples(start_frame, end_frame))
+    progress = (frames - start_frame) / (end_frame - start_frame)
+    if props.use_easing:
+        progress = smoothstep(progress)
+
+    world = world_path(camera, target_obj, target_loc, progress, props)
+    distances = np.linalg.norm(world - np.array(target_world), axis=1)
+    lenses = np.maximum(1.0, initial_lens * distances / initial_distance)
+    positions = path(camera, target_obj, target_loc, progress, props)
+
+    frames = frames.tolist()
+    write_keyframes(camera, "location", frames, positions.tolist())
+    write_keyframes(cam_data, "lens", frames, lenses[:, np.newaxis].tolist())
+    return {"location": SAMPLED, "lens": SAMPLED}
@@ -0,0 +1,98 @@
+import bpy
+import numpy as np
+from mathutils import Vector
+from mathutils.geometry import interpolate_bezier
+
+from . import EASE
+from ..timing import smoothstep
+
+# Pontos por segmento Bezier ao amostrar a curva para o preview
+CURVE_RESOLUTION = 12
+
+
+def find_curve(context):
+    curves = [obj for obj in context.scene.objects if obj.type == 'CURVE']
+    return curves[0] if curves else None
+
+
+def curve_points(curve):
+    """Pontos da primeira spline da curva em espaço de mundo, ou None sem splines."""
+    if not curve.data.splines:
+        return None
+    spline = curve.data.splines[0]
+
+    if spline.type == 'BEZIER':
+        bezier = list(spline.bezier_points)
+        if spline.use_cyclic_u:
+            bezier.append(bezier[0])
+
+        points = [bezier[0].co]
+        for a, b in zip(bezier[:-1], bezier[1:]):
+            points.extend(interpolate_bezier(a.co, a.handle_right, b.handle_left, b.co,
+                                             CURVE_RESOLUTION)[1:])
+    else:
+        points = [point.co.xyz for point in spline.points]
+
+    return np.array([tuple(curve.matrix_world @ point) for point in points])
+
+
+def trajectory(context, camera, target_obj, target_loc, start_frame, end_frame, times, props):
+    curve = find_curve(context)
+    if curve is not None:
+        points = curve_points(curve)
+        if points is None:
+            return None
+    else:
+        # A curva que o movimento criaria: reta de move_distance em Y a partir da câmera
+        points = np.array((tuple(camera.location),
+                           tuple(camera.location + Vector((0, props.move_distance, 0)))))
+
+    # O Follow Path percorre a curva por comprimento; a localização da câmera vira offset
+    lengths = np.concatenate(((0.0,), np.cumsum(np.linalg.norm(np.diff(points, axis=0), axis=1))))
+    progress = smoothstep(times) if props.use_easing else times
+    distance = progress * lengths[-1]
+
+    positions = np.column_stack([np.interp(distance, lengths, c) for c in points.T])
+    positions += np.array(camera.location)
+
+    # Com use_curve_follow o -Z da câmera acompanha a tangente
+    directions = np.gradient(positions, axis=0) if len(positions) > 1 else np.zeros_like(positions)
+
+    # O constraint já resolve em espaço de mundo; o preview reaplica o parent
+    if camera.parent:
+        to_local = np.array((camera.parent.matrix_world @ camera.matrix_parent_inverse).inverted())
+        positions = positions @ to_local[:3, :3].T + to_local[:3, 3]
+        directions = directions @ to_local[:3, :3].T
+    return positions, directions
+
+
+def generate(context, camera, target_obj, target_loc, start_frame, end_frame, props):
+    curve = find_curve(context)
+
+    if curve is None:
+        bpy.ops.curve.primitive_bezier_curve_add(location=camera.location)
+        curve = context.active_object
+        curve.name = "QCM_CameraPath"
+
+        spline = curve.data.splines[0]
+        spline.bezier_points[0].co = Vector((0, 0, 0))
+        spline.bezier_points[1].co = Vector((0, props.move_distance, 0))
+
+    for c in list(camera.constraints):
+        if c.name == "QCM_FollowPath":
+            camera.constraints.remove(c)
+
+    constraint = camera.constraints.new('FOLLOW_PATH')
+    constraint.name = "QCM_FollowPath"
+    constraint.target = curve
+    constraint.use_curve_follow = True
+    constraint.forward_axis = 'TRACK_NEGATIVE_Z'
+    constraint.up_axis = 'UP_Y'
+
+    constraint.offset = 0
+    constraint.keyframe_insert(data_path="offset", frame=start_frame)
+
+    constraint.offset = -100
+    constraint.keyframe_insert(data_path="offset", frame=end_frame)
+
+    return {constraint.path_from_id("offset"): EASE}
@@ -0,0 +1,42 @@
+import numpy as np
+from mathutils import Vector
+
+from . import EASE, TIMED
+from ..timing import progress_remap, smoothstep
+from ..utils import key_path, key_rotation, rotation_directions, suspend_track_constraint
+
+
+def path(camera, target_obj, target_loc, progress, props):
+    direction = (target_loc - camera.location).normalized()
+
+    progress = np.asarray(progress, dtype=float)
+    return np.array(camera.location) + np.outer(progress * props.move_distance, np.array(direction))
+
+
+def look_rotation(camera, target_loc):
+    # O push anda na linha até o target, então a mira inicial continua valendo
+    # durante todo o movimento; com o QCM_Track desligado o tilt fica visível.
+    return (target_loc - camera.location).normalized().to_track_quat('-Z', 'Y')
+
+
+def trajectory(context, camera, target_obj, target_loc, start_frame, end_frame, times, props):
+    progress = smoothstep(times) if props.use_easing else times
+    positions = path(camera, target_obj, target_loc, progress, props)
+    directions = rotation_directions(look_rotation(camera, target_loc), Vector((1, 0, 0)),
+                                     props.tilt_angle, True, props.tilt_profile, times)
+    return positions, np.array(directions)
+
+
+def generate(context, camera, target_obj, target_loc, start_frame, end_frame, props):
+    context.scene.frame_set(start_frame)
+
+    look = look_rotation(camera, target_loc)
+    suspend_track_constraint(camera, start_frame, end_frame)
+
+    key_path(camera, path, target_obj, target_loc, start_frame, end_frame, props)
+
+    data_path = key_rotation(camera, Vector((1, 0, 0)), props.tilt_angle, True,
+                             start_frame, end_frame, props.tilt_profile, props.rotation_tolerance,
+                             start_rotation=look, remap=progress_remap(props))
+
+    return {"location": EASE, data_path: TIMED}
@@ -0,0 +1,76 @@
+import random
+
+import numpy as np
+from mathutils import Euler, Vector
+
+from . import SAMPLED
+from ..timing import scene_fps
+from ..utils import write_keyframes
+
+
+def shake_keys(camera, start_frame, end_frame, props, fps):
+    """Chaves da tremida: (frames, localizações, rotações).
+
+    A semente vem de `shake_seed`, então o preview mostra a mesma tremida que
+    o movimento grava; outra semente gera outra tomada.
+    """
+    rng = random.Random(props.shake_seed)
+    initial_loc = camera.location.copy()
+    initial_rot = camera.rotation_euler.copy()
+
+    intensity = props.shake_intensity * 0.1
+    rot_intensity = props.shake_intensity * 0.02
+
+    frames_per_shake = max(1.0, fps / (props.shake_frequency * 4))
+    count = int((end_frame - start_frame) / frames_per_shake)
+
+    frames = []
+    locations = []
+    rotations = []
+    for i in range(count + 1):
+        frame = start_frame + i * frames_per_shake
+        if frame >= end_frame:
+            break
+        frames.append(frame)
+        locations.append((
+            initial_loc.x + rng.uniform(-intensity, intensity),
+            initial_loc.y + rng.uniform(-intensity, intensity),
+            initial_loc.z + rng.uniform(-intensity * 0.5, intensity * 0.5),
+        ))
+        rotations.append((
+            initial_rot.x + rng.uniform(-rot_intensity, rot_intensity),
+            initial_rot.y + rng.uniform(-rot_intensity, rot_intensity),
+            initial_rot.z + rng.uniform(-rot_intensity * 0.5, rot_intensity * 0.5),
+        ))
+
+    frames.append(end_frame)
+    locations.append(tuple(initial_loc))
+    rotations.append(tuple(initial_rot))
+    return frames, locations, rotations
+
+
+def trajectory(context, camera, target_obj, target_loc, start_frame, end_frame, times, props):
+    frames, locations, rotations = shake_keys(camera, start_frame, end_frame, props,
+                                              scene_fps(context.scene))
+    progress = (np.array(frames) - start_frame) / (end_frame - start_frame)
+
+    # As chaves são lineares, então interpolar entre elas reproduz a curva
+    positions = np.column_stack([np.interp(times, progress, c) for c in np.array(locations).T])
+
+    if camera.rotation_mode in {'QUATERNION', 'AXIS_ANGLE'}:
+        # A tremida grava rotation_euler, que não vale nesses modos
+        look = camera.matrix_basis.decompose()[1] @ Vector((0, 0, -1))
+        return positions, np.tile(np.array(look), (len(times), 1))
+
+    angles = np.column_stack([np.interp(times, progress, c) for c in np.array(rotations).T])
+    directions = [tuple(Euler(a, camera.rotation_mode).to_matrix() @ Vector((0, 0, -1))) for a in angles]
+    return positions, np.array(directions)
+
+
+def generate(context, camera, target_obj, target_loc, start_frame, end_frame, props):
+    frames, locations, rotations = shake_keys(camera, start_frame, end_frame, props,
+                                              scene_fps(context.scene))
+
+    write_keyframes(camera, "location", frames, locations)
+    write_keyframes(camera, "rotation_euler", frames, rotations)
+    return {"location": SAMPLED, "rotation_euler": SAMPLED}
@@ -0,0 +1,29 @@
+import numpy as np
+from mathutils import Vector
+
+from . import EASE
+from ..utils import add_track_constraint, key_path
+
+
+def path(camera, target_obj, target_loc, progress, props):
+    forward = (target_loc - camera.location).normalized()
+    up = Vector((0, 0, 1))
+    right = forward.cross(up).normalized()
+
+    if props.move_type == 'TRUCK_LEFT':
+        right = -right
+
+    progress = np.asarray(progress, dtype=float)
+    return np.array(camera.location) + np.outer(progress * props.move_distance, np.array(right))
+
+
+def generate(context, camera, target_obj, target_loc, start_frame, end_frame, props):
+    context.scene.frame_set(start_frame)
+    key_path(camera, path, target_obj, target_loc, start_frame, end_frame, props)
+
+    if target_obj:
+        add_track_constraint(camera, target_obj=target_obj, start_frame=start_frame)
+    else:
+        add_track_constraint(camera, target_loc=target_loc, start_frame=start_frame)
+
+    return {"location": EASE}
@@ -0,0 +1,27 @@
+import numpy as np
+from mathutils import Vector
+
+from . import TIMED
+from ..timing import progress_remap
+from ..utils import key_rotation, rotation_directions, suspend_track_constraint, track_rotation
+
+
+def trajectory(context, camera, target_obj, target_loc, start_frame, end_frame, times, props):
+    positions = np.tile(np.array(camera.location), (len(times), 1))
+    directions = rotation_directions(track_rotation(camera), Vector((0, 0, 1)), props.orbit_angle,
+                                     False, props.rotation_profile, times)
+    return positions, np.array(directions)
+
+
+def generate(context, camera, target_obj, target_loc, start_frame, end_frame, props):
+    context.scene.frame_set(start_frame)
+
+    # Parte de onde o QCM_Track dos movimentos anteriores está mirando e
+    # desliga o constraint só durante o whip, para não anular a rotação
+    look = track_rotation(camera)
+    suspend_track_constraint(camera, start_frame, end_frame)
+
+    data_path = key_rotation(camera, Vector((0, 0, 1)), props.orbit_angle, False,
+                             start_frame, end_frame, props.rotation_profile, props.rotation_tolerance,
+                             start_rotation=look, remap=progress_remap(props))
+    return {data_path: TIMED}
@@ -0,0 +1,36 @@
+import numpy as np
+
+from . import EASE
+from ..utils import add_track_constraint, remove_lens_driver
+
+
+def path(camera, target_obj, target_loc, progress, props):
+    # Zoom só mexe na lente; a câmera fica parada
+    return np.tile(np.array(camera.location), (len(progress), 1))
+
+
+def generate(context, camera, target_obj, target_loc, start_frame, end_frame, props):
+    cam_data = camera.data
+
+    lens_start = props.zoom_fov_start
+    lens_end = props.zoom_fov_end
+
+    if props.move_type == 'ZOOM_OUT':
+        lens_start, lens_end = lens_end, lens_start
+
+    # Um driver do Dolly Zoom anularia as chaves de lente
+    remove_lens_driver(cam_data)
+
+    context.scene.frame_set(start_frame)
+    cam_data.lens = lens_start
+    cam_data.keyframe_insert(data_path="lens", frame=start_frame)
+
+    cam_data.lens = lens_end
+    cam_data.keyframe_insert(data_path="lens", frame=end_frame)
+
+    if target_obj:
+        add_track_constraint(camera, target_obj=target_obj, start_frame=start_frame)
+    else:
+        add_track_constraint(camera, target_loc=target_loc, start_frame=start_frame)
+
+    return {"lens": EASE}
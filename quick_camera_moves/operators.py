@@ -0,0 +1,116 @@
+import bpy
+import math
+
+from . import moves
+from .utils import (
+    get_active_camera,
+    get_target_location,
+    set_keyframe_interpolation,
+    set_keyframe_interpolation_camera_data,
+    remove_qcm_objects,
+)
+
+
+class QCM_OT_create_move(bpy.types.Operator):
+    bl_idname = "qcm.create_move"
+    bl_label = "Criar Movimento"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        from . import preview, timing
+
+        props = context.scene.qcm_props
+        camera = get_active_camera(context)
+
+        if not camera:
+            self.report({'ERROR'}, "Nenhuma câmera ativa na cena")
+            return {'CANCELLED'}
+
+        fps = timing.scene_fps(context.scene)
+        start_frame = context.scene.frame_current
+        end_frame = start_frame + props.duration * fps
+
+        target_obj = props.target_object
+        target_loc = get_target_location(context)
+
+        move_type = props.move_type
+        info = moves.MOVES.get(move_type)
+
+        if info is None:
+            self.report({'ERROR'}, "Tipo de movimento não instalado")
+            return {'CANCELLED'}
+
+        generate = moves.get_generator(move_type)
+        keyed = generate(context, camera, target_obj, target_loc, start_frame, end_frame, props) or {}
+
+        # Só as chaves deste movimento; curvas e movimentos anteriores ficam como estão
+        eased = {path for path, mode in keyed.items() if mode == moves.EASE}
+        frame_range = (start_frame, end_frame)
+
+        if info.apply_easing:
+            set_keyframe_interpolation(camera, props.use_easing, eased, frame_range)
+            set_keyframe_interpolation_camera_data(camera, props.use_easing, eased, frame_range)
+
+        lut = timing.props_lut(props)
+        if lut is not None:
+            remapped = {path for path, mode in keyed.items() if mode != moves.TIMED}
+            timing.apply_time_remap(camera, start_frame, end_frame, lut, remapped)
+
+        if props.show_preview:
+            preview.update_preview(context)
+
+        context.scene.frame_end = max(context.scene.frame_end, math.ceil(end_frame))
+
+        self.report({'INFO'}, f"Movimento '{move_type}' criado: frames {start_frame}-{end_frame:g}")
+        return {'FINISHED'}
+
+
+class QCM_OT_clear_animation(bpy.types.Operator):
+    bl_idname = "qcm.clear_animation"
+    bl_label = "Limpar Animação"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        camera = get_active_camera(context)
+
+        if not camera:
+            self.report({'ERROR'}, "Nenhuma câmera ativa")
+            return {'CANCELLED'}
+
+        camera.animation_data_clear()
+
+        if camera.data.animation_data:
+            camera.data.animation_data_clear()
+
+        for c in list(camera.constraints):
+            if c.name.startswith("QCM_"):
+                camera.constraints.remove(c)
+
+        from . import preview
+        preview.remove_preview()
+        remove_qcm_objects()
+
+        self.report({'INFO'}, "Animação da câmera removida")
+        return {'FINISHED'}
+
+
+class QCM_OT_preview(bpy.types.Operator):
+    bl_idname = "qcm.preview"
+    bl_label = "Preview"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        from . import preview
+
+        camera = get_active_camera(context)
+
+        if not camera:
+            self.report({'ERROR'}, "Nenhuma câmera ativa")
+            return {'CANCELLED'}
+
+        if preview.update_preview(context) is None:
+            self.report({'WARNING'}, "Movimento sem preview de trajetória")
+            return {'CANCELLED'}
+
+        context.scene.qcm_props.show_preview = True
+        return {'FINISHED'}
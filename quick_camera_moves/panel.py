@@ -0,0 +1,64 @@
+import bpy
+
+from . import moves
+from .utils import get_active_camera
+
+
+class QCM_PT_main_panel(bpy.types.Panel):
+    bl_label = "Quick Camera Moves"
+    bl_idname = "QCM_PT_main_panel"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Camera Moves"
+
+    def draw(self, context):
+        layout = self.layout
+        props = context.scene.qcm_props
+        camera = get_active_camera(context)
+
+        box = layout.box()
+        if camera:
+            box.label(text=f"Câmera: {camera.name}", icon='CAMERA_DATA')
+        else:
+            box.label(text="Sem câmera ativa!", icon='ERROR')
+
+        layout.prop(props, "target_object", icon='OBJECT_DATA')
+        if not props.target_object:
+            layout.label(text="Usando 3D Cursor como target", icon='CURSOR')
+
+        layout.separator()
+
+        layout.prop(props, "move_type")
+        layout.prop(props, "duration")
+
+        layout.separator()
+
+        info = moves.MOVES.get(props.move_type)
+
+        if info:
+            for prop in info.props:
+                layout.prop(props, prop)
+
+            layout.separator()
+
+            if info.easing:
+                layout.prop(props, "use_easing")
+
+        layout.prop(props, "use_time_remap")
+        if props.use_time_remap:
+            from . import timing
+            node = timing.get_remap_node()
+            if node:
+                layout.template_curve_mapping(node, "mapping")
+
+        layout.separator()
+
+        row = layout.row(align=True)
+        row.scale_y = 1.5
+        row.operator("qcm.create_move", icon='PLAY')
+
+        layout.prop(props, "show_preview")
+
+        row = layout.row(align=True)
+        row.operator("qcm.preview", icon='PREVIEW_RANGE')
+        row.operator("qcm.clear_animation", icon='X')
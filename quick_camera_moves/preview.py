@@ -0,0 +1,163 @@
+"""Preview da trajetória da câmera como uma mesh leve de arestas.
+
+A trajetória vem direto das funções `path`/`trajectory` dos movimentos, com
+os parâmetros atuais do painel e sem gravar chaves, e é escrita na mesh com
+`foreach_set`. Se só as posições mudaram, a topologia é reaproveitada; se
+nenhuma entrada mudou, nada é refeito.
+"""
+
+import bpy
+import numpy as np
+
+from . import moves
+from .timing import frame_samples, props_lut, scene_fps, smoothstep
+from .utils import get_active_camera, get_target_location
+
+PREVIEW_COLLECTION = "QCM_Preview"
+PREVIEW_OBJECT = "QCM_Preview_Path"
+
+# Marcador de direção do olhar a cada N frames
+LOOK_MARKER_STEP = 6
+
+# Propriedades que valem para todos os movimentos; as demais vêm de MoveInfo.props
+SIGNATURE_PROPS = ("move_type", "target_object", "duration", "use_easing", "use_time_remap")
+
+_cache = {}
+
+
+def compute_trajectory(context, camera, props, info, lut):
+    """(posições, direções) em espaço de mundo, um item por frame, ou None sem preview."""
+    module = moves.get_module(info.identifier)
+
+    start_frame = context.scene.frame_current
+    end_frame = start_frame + props.duration * scene_fps(context.scene)
+    frames = np.array(frame_samples(start_frame, end_frame))
+    times = (frames - start_frame) / (end_frame - start_frame)
+    if lut is not None:
+        times = np.interp(times, *lut)
+
+    target_obj = props.target_object
+    target_loc = get_target_location(context)
+
+    if hasattr(module, "trajectory"):
+        result = module.trajectory(context, camera, target_obj, target_loc,
+                                   start_frame, end_frame, times, props)
+        if result is None:
+            return None
+        positions, directions = result
+    elif hasattr(module, "path"):
+        progress = smoothstep(times) if props.use_easing and info.apply_easing else times
+        positions = module.path(camera, target_obj, target_loc, progress, props)
+        directions = np.array(target_loc) - positions
+    else:
+        return None
+
+    if camera.parent:
+        parent = np.array(camera.parent.matrix_world @ camera.matrix_parent_inverse)
+        positions = positions @ parent[:3, :3].T + parent[:3, 3]
+        directions = directions @ parent[:3, :3].T
+    return positions, directions
+
+
+def preview_signature(context, camera, props, info, lut):
+    values = tuple(repr(getattr(props, name)) for name in SIGNATURE_PROPS + info.props)
+    matrix = tuple(v for row in camera.matrix_world for v in row)
+    target = tuple(get_target_location(context))
+    scene = (context.scene.frame_current, scene_fps(context.scene))
+    remap = lut[1].tobytes() if lut is not None else None
+    return camera.name, hash((values, matrix, target, scene, remap))
+
+
+def preview_geometry(positions, directions):
+    """Vértices e arestas: polilinha do caminho, ticks por frame e marcadores de direção."""
+    count = len(positions)
+    extent = max(float((positions.max(axis=0) - positions.min(axis=0)).max()), 1.0)
+    tick_size = extent * 0.01
+    marker_size = extent * 0.08
+
+    look = np.arange(0, count, LOOK_MARKER_STEP)
+    dirs = directions[look]
+    dirs = dirs / np.maximum(np.linalg.norm(dirs, axis=1, keepdims=True), 1e-9)
+
+    ticks = positions + (0.0, 0.0, tick_size)
+    markers = positions[look] + dirs * marker_size
+    verts = np.concatenate((positions, ticks, markers))
+
+    indices = np.arange(count)
+    edges = np.concatenate((
+        np.column_stack((indices[:-1], indices[1:])),
+        np.column_stack((indices, indices + count)),
+        np.column_stack((look, np.arange(len(look)) + 2 * count)),
+    ))
+    return verts, edges
+
+
+def write_mesh(mesh, verts, edges):
+    # A topologia só depende da quantidade de frames, então basta comparar contagens
+    if len(mesh.vertices) != len(verts) or len(mesh.edges) != len(edges):
+        mesh.clear_geometry()
+        mesh.vertices.add(len(verts))
+        mesh.edges.add(len(edges))
+        mesh.edges.foreach_set("vertices", edges.astype(np.int32).ravel())
+    mesh.vertices.foreach_set("co", verts.astype(np.float32).ravel())
+    mesh.update()
+
+
+def ensure_preview_object(context):
+    collection = bpy.data.collections.get(PREVIEW_COLLECTION)
+    if collection is None:
+        collection = bpy.data.collections.new(PREVIEW_COLLECTION)
+        collection.hide_render = True
+    if collection.name not in context.scene.collection.children:
+        context.scene.collection.children.link(collection)
+
+    obj = bpy.data.objects.get(PREVIEW_OBJECT)
+    if obj is None:
+        mesh = bpy.data.meshes.new(PREVIEW_OBJECT)
+        obj = bpy.data.objects.new(PREVIEW_OBJECT, mesh)
+        obj.hide_render = True
+        obj.hide_select = True
+        collection.objects.link(obj)
+    return obj
+
+
+def update_preview(context):
+    """Atualiza a mesh de preview com o movimento do painel; None se não há preview."""
+    props = context.scene.qcm_props
+    camera = get_active_camera(context)
+    info = moves.MOVES.get(props.move_type)
+    if camera is None or info is None:
+        remove_preview()
+        return None
+
+    lut = props_lut(props)
+    obj = bpy.data.objects.get(PREVIEW_OBJECT)
+    signature = preview_signature(context, camera, props, info, lut)
+    if obj is not None and _cache.get("signature") == signature:
+        return obj
+
+    trajectory = compute_trajectory(context, camera, props, info, lut)
+    if trajectory is None:
+        remove_preview()
+        return None
+
+    verts, edges = preview_geometry(*trajectory)
+    obj = ensure_preview_object(context)
+    write_mesh(obj.data, verts, edges)
+
+    _cache["signature"] = signature
+    return obj
+
+
+def remove_preview():
+    obj = bpy.data.objects.get(PREVIEW_OBJECT)
+    if obj is not None:
+        mesh = obj.data
+        bpy.data.objects.remove(obj, do_unlink=True)
+        bpy.data.meshes.remove(mesh)
+
+    collection = bpy.data.collections.get(PREVIEW_COLLECTION)
+    if collection is not None:
+        bpy.data.collections.remove(collection)
+
+    _cache.clear()
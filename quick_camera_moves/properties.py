@@ -0,0 +1,222 @@
+import bpy
+import math
+from bpy.props import (
+    EnumProperty,
+    FloatProperty,
+    IntProperty,
+    PointerProperty,
+    BoolProperty,
+)
+
+from . import moves
+
+
+ROTATION_PROFILES = [
+    ('LINEAR', "Linear", "Velocidade angular constante"),
+    ('EASE', "Ease In/Out", "Acelera e desacelera suavemente"),
+    ('WHIP', "Whip", "Pico de velocidade no meio, bom para motion blur"),
+]
+
+
+def move_type_items(self, context):
+    return moves.enum_items()
+
+
+def update_show_preview(self, context):
+    from . import preview
+
+    if self.show_preview:
+        preview.update_preview(context)
+    else:
+        preview.remove_preview()
+
+
+def refresh_preview(self, context):
+    # O preview carrega numpy; só é importado quando está ligado
+    if self.show_preview:
+        from . import preview
+        preview.update_preview(context)
+
+
+def update_use_time_remap(self, context):
+    if self.use_time_remap:
+        from . import timing
+        timing.get_remap_node(create=True)
+    refresh_preview(self, context)
+
+
+class QCM_Properties(bpy.types.PropertyGroup):
+
+    target_object: PointerProperty(
+        name="Target",
+        description="Objeto que a câmera vai seguir",
+        type=bpy.types.Object,
+        update=refresh_preview
+    )
+
+    move_type: EnumProperty(
+        name="Movimento",
+        description="Tipo de movimento da câmera",
+        items=move_type_items,
+        update=refresh_preview
+    )
+
+    duration: FloatProperty(
+        name="Duração",
+        description="Duração do movimento em segundos",
+        default=2.0,
+        min=0.1,
+        max=60.0,
+        unit='TIME',
+        update=refresh_preview
+    )
+
+    orbit_angle: FloatProperty(
+        name="Ângulo",
+        description="Ângulo de rotação",
+        default=math.radians(360.0),
+        min=math.radians(-720.0),
+        max=math.radians(720.0),
+        subtype='ANGLE',
+        update=refresh_preview
+    )
+
+    move_distance: FloatProperty(
+        name="Distância",
+        description="Distância do movimento",
+        default=5.0,
+        min=0.1,
+        max=100.0,
+        unit='LENGTH',
+        update=refresh_preview
+    )
+
+    show_preview: BoolProperty(
+        name="Mostrar Trajetória",
+        description="Mostra o caminho da câmera com ticks por frame e direção do olhar",
+        default=False,
+        update=update_show_preview
+    )
+
+    use_time_remap: BoolProperty(
+        name="Rampa de Velocidade",
+        description="Remapeia o tempo do movimento com uma curva",
+        default=False,
+        update=update_use_time_remap
+    )
+
+    use_easing: BoolProperty(
+        name="Easing Suave",
+        description="Aplica ease in/out na animação",
+        default=True,
+        update=refresh_preview
+    )
+
+    dolly_zoom_intensity: FloatProperty(
+        name="Intensidade",
+        description="Intensidade do efeito Vertigo",
+        default=1.0,
+        min=0.1,
+        max=3.0,
+        update=refresh_preview
+    )
+
+    shake_intensity: FloatProperty(
+        name="Intensidade",
+        description="Intensidade da tremida",
+        default=0.5,
+        min=0.1,
+        max=2.0,
+        update=refresh_preview
+    )
+
+    shake_frequency: FloatProperty(
+        name="Frequência",
+        description="Velocidade da tremida",
+        default=2.0,
+        min=0.5,
+        max=10.0,
+        update=refresh_preview
+    )
+
+    shake_seed: IntProperty(
+        name="Semente",
+        description="Variação aleatória da tremida; mude para gerar outra tomada",
+        default=0,
+        min=0,
+        update=refresh_preview
+    )
+
+    arc_height: FloatProperty(
+        name="Altura do Arco",
+        description="Variação de altura durante o arco",
+        default=2.0,
+        min=0.0,
+        max=20.0,
+        unit='LENGTH',
+        update=refresh_preview
+    )
+
+    tilt_angle: FloatProperty(
+        name="Ângulo Tilt",
+        description="Ângulo de inclinação vertical",
+        default=math.radians(15.0),
+        min=math.radians(-90.0),
+        max=math.radians(90.0),
+        subtype='ANGLE',
+        update=refresh_preview
+    )
+
+    zoom_fov_start: FloatProperty(
+        name="Lens Inicial (mm)",
+        description="Distância focal inicial",
+        default=50.0,
+        min=1.0,
+        max=500.0,
+        update=refresh_preview
+    )
+
+    zoom_fov_end: FloatProperty(
+        name="Lens Final (mm)",
+        description="Distância focal final",
+        default=100.0,
+        min=1.0,
+        max=500.0,
+        update=refresh_preview
+    )
+
+    dolly_zoom_mode: EnumProperty(
+        name="Modo",
+        description="Como a lente acompanha a distância até o target",
+        items=[
+            ('BAKE', "Bake por Frame", "Grava a lente exata em cada frame"),
+            ('DRIVER', "Driver", "Calcula a lente pela distância real até o target"),
+        ],
+        default='BAKE',
+        update=refresh_preview
+    )
+
+    rotation_profile: EnumProperty(
+        name="Perfil de Rotação",
+        description="Perfil de velocidade angular da rotação",
+        items=ROTATION_PROFILES,
+        default='WHIP',
+        update=refresh_preview
+    )
+
+    tilt_profile: EnumProperty(
+        name="Perfil do Tilt",
+        description="Perfil de velocidade angular do tilt",
+        items=ROTATION_PROFILES,
+        default='EASE',
+        update=refresh_preview
+    )
+
+    rotation_tolerance: FloatProperty(
+        name="Tolerância",
+        description="Erro angular máximo entre as chaves e a rotação exata",
+        default=math.radians(0.1),
+        min=math.radians(0.001),
+        max=math.radians(5.0),
+        subtype='ANGLE'
+    )
@@ -0,0 +1,131 @@
+"""Tempo contínuo e rampa de velocidade.
+
+Os movimentos trabalham com frames fracionários: o fim é
+`start + duração * fps / fps_base`, sem arredondar. A rampa de velocidade é
+uma curva do usuário (um nó Float Curve guardado num node group próprio)
+amostrada uma vez numa tabela; cada chave só faz uma interpolação nela.
+"""
+
+import math
+
+import bpy
+import numpy as np
+
+from .utils import write_keyframes
+
+REMAP_NODE_GROUP = "QCM_TimeRemap"
+REMAP_NODE = "Remap"
+
+# Resolução da tabela da rampa de velocidade
+REMAP_LUT_SIZE = 256
+
+
+def scene_fps(scene):
+    return scene.render.fps / scene.render.fps_base
+
+
+def smoothstep(progress):
+    """Aproximação do easing Bezier ease-in-out usada nas amostras e no preview."""
+    return progress * progress * (3 - 2 * progress)
+
+
+def frame_samples(start_frame, end_frame):
+    """Frames inteiros a partir de `start_frame` mais o fim exato, que pode ser fracionário."""
+    frames = [float(f) for f in range(math.ceil(start_frame), math.floor(end_frame) + 1)]
+    if not frames or frames[0] > start_frame:
+        frames.insert(0, float(start_frame))
+    if frames[-1] < end_frame:
+        frames.append(float(end_frame))
+    return frames
+
+
+def bake_path(camera, path, target_obj, target_loc, start_frame, end_frame, props):
+    """Grava a localização de `path` em cada frame, já com o easing.
+
+    Com várias chaves BEZIER o ease ficaria só no primeiro e no último
+    segmento; amostrado, o movimento segue o mesmo progresso do preview.
+    """
+    frames = np.array(frame_samples(start_frame, end_frame))
+    progress = (frames - start_frame) / (end_frame - start_frame)
+    if props.use_easing:
+        progress = smoothstep(progress)
+
+    positions = path(camera, target_obj, target_loc, progress, props)
+    write_keyframes(camera, "location", frames.tolist(), positions.tolist())
+
+
+def get_remap_node(create=False):
+    group = bpy.data.node_groups.get(REMAP_NODE_GROUP)
+    if group is None:
+        if not create:
+            return None
+        group = bpy.data.node_groups.new(REMAP_NODE_GROUP, 'ShaderNodeTree')
+        group.use_fake_user = True
+
+    node = group.nodes.get(REMAP_NODE)
+    if node is None and create:
+        node = group.nodes.new('ShaderNodeFloatCurve')
+        node.name = REMAP_NODE
+    return node
+
+
+def props_lut(props):
+    """Tabela da rampa de velocidade das propriedades, ou None se desativada."""
+    if not props.use_time_remap:
+        return None
+    node = get_remap_node()
+    return remap_lut(node) if node else None
+
+
+def progress_remap(props):
+    """Função progresso -> progresso remapeado, ou None se não há rampa."""
+    lut = props_lut(props)
+    if lut is None:
+        return None
+    return lambda t: float(np.interp(t, *lut))
+
+
+def remap_lut(node):
+    """Amostra a curva em (progresso, progresso remapeado), normalizada para ir de 0 a 1."""
+    mapping = node.mapping
+    mapping.initialize()
+    curve = mapping.curves[0]
+
+    x = np.linspace(0.0, 1.0, REMAP_LUT_SIZE)
+    y = np.array([mapping.evaluate(curve, v) for v in x])
+
+    span = y[-1] - y[0]
+    if abs(span) < 1e-9:
+        return None
+    return x, (y - y[0]) / span
+
+
+def apply_time_remap(camera, start_frame, end_frame, lut, data_paths):
+    """Reamostra as curvas de `data_paths` para que o progresso siga a rampa.
+
+    Só os canais gravados pelo movimento são tocados; cada frame recebe o valor
+    que a curva original tinha no instante remapeado.
+    """
+    frames = np.array(frame_samples(start_frame, end_frame))
+    progress = (frames - start_frame) / (end_frame - start_frame)
+    source = start_frame + (end_frame - start_frame) * np.interp(progress, *lut)
+    frames = frames.tolist()
+
+    for id_data in (camera, camera.data):
+        anim = id_data.animation_data
+        if not (anim and anim.action):
+            continue
+
+        channels = {}
+        for fcurve in anim.action.fcurves:
+            first, last = fcurve.range()
+            if fcurve.data_path not in data_paths or not fcurve.keyframe_points:
+                continue
+            if first <= end_frame and last >= start_frame:
+                channels.setdefault(fcurve.data_path, []).append(fcurve)
+
+        for data_path, fcurves in channels.items():
+            fcurves.sort(key=lambda fc: fc.array_index)
+            values = [[fcurve.evaluate(frame) for fcurve in fcurves] for frame in source]
+            indices = [fcurve.array_index for fcurve in fcurves]
+            write_keyframes(id_data, data_path, frames, values, indices=indices)
@@ -0,0 +1,343 @@
+import bpy
+import math
+from mathutils import Euler, Quaternion, Vector
+
+
+# Amostras por frame usadas para medir o erro da rotação antes de reduzir as chaves
+ROTATION_SUBSAMPLES = 2
+
+# Passo angular máximo entre amostras da rotação, em múltiplos da tolerância
+ROTATION_MAX_STEP = 4
+
+# Resolução usada para achar o pico de velocidade do perfil de rotação
+PROFILE_PEAK_SAMPLES = 1024
+
+TRACK_CONSTRAINT = "QCM_Track"
+
+# Nome da variável que identifica o driver de lente criado pelo Dolly Zoom
+LENS_DRIVER_VAR = "qcm_dist"
+
+
+def get_active_camera(context):
+    if context.scene.camera:
+        return context.scene.camera
+    return None
+
+
+def get_target_location(context):
+    props = context.scene.qcm_props
+    if props.target_object:
+        return props.target_object.location.copy()
+    return context.scene.cursor.location.copy()
+
+
+def set_keyframe_interpolation(obj, easing=True, data_paths=None, frame_range=None):
+    """Aplica a interpolação só nas chaves de `data_paths` dentro de `frame_range`.
+
+    Sem `data_paths`/`frame_range`, vale para todas as curvas e chaves.
+    """
+    if obj.animation_data and obj.animation_data.action:
+        for fcurve in obj.animation_data.action.fcurves:
+            if data_paths is not None and fcurve.data_path not in data_paths:
+                continue
+            for keyframe in fcurve.keyframe_points:
+                if frame_range and not frame_range[0] <= keyframe.co.x <= frame_range[1]:
+                    continue
+                if easing:
+                    keyframe.interpolation = 'BEZIER'
+                    keyframe.easing = 'EASE_IN_OUT'
+                else:
+                    keyframe.interpolation = 'LINEAR'
+
+
+def set_keyframe_interpolation_camera_data(camera, easing=True, data_paths=None, frame_range=None):
+    set_keyframe_interpolation(camera.data, easing, data_paths, frame_range)
+
+
+def rotation_profile(t, profile):
+    if profile == 'EASE':
+        return t * t * (3 - 2 * t)
+    if profile == 'WHIP':
+        a = t ** 3
+        return a / (a + (1 - t) ** 3)
+    return t
+
+
+def angle_between(q1, q2):
+    # Pela distância entre os quaternions: o acos do produto escalar não resolve
+    # ângulos da ordem da tolerância em float32
+    diff = math.sqrt(sum((a - b) ** 2 for a, b in zip(q1, q2)))
+    total = math.sqrt(sum((a + b) ** 2 for a, b in zip(q1, q2)))
+    return 4 * math.asin(min(1.0, min(diff, total) / 2))
+
+
+def peak_rate(progress):
+    """Maior derivada de `progress` em [0, 1], por diferenças numa grade fina."""
+    values = [progress(i / PROFILE_PEAK_SAMPLES) for i in range(PROFILE_PEAK_SAMPLES + 1)]
+    return max(abs(b - a) for a, b in zip(values, values[1:])) * PROFILE_PEAK_SAMPLES
+
+
+def rotation_to_quaternion(values, rotation_mode):
+    if rotation_mode == 'QUATERNION':
+        return Quaternion(values).normalized()
+    return Euler(values, rotation_mode).to_quaternion()
+
+
+def rotation_directions(q_start, axis, angle, local, profile, times):
+    """Direção do olhar (-Z local) da rotação em torno de `axis` em cada progresso de `times`."""
+    directions = []
+    for t in times:
+        step = Quaternion(axis, angle * rotation_profile(t, profile))
+        q = q_start @ step if local else step @ q_start
+        directions.append(tuple(q @ Vector((0, 0, -1))))
+    return directions
+
+
+def sample_rotation(start_value, axis, angle, local, rotation_mode, frame_count, profile, tolerance,
+                    remap=None):
+    """Amostra a rotação em torno de `axis` e mantém só as chaves necessárias.
+
+    A rotação é avaliada em quaternion (sem gimbal flip, funciona acima de 180°),
+    convertida para valores contínuos no `rotation_mode` da câmera e reduzida
+    até que a interpolação linear entre chaves fique dentro de `tolerance` radianos.
+    `remap` (opcional) converte o progresso no tempo em progresso do movimento,
+    aplicando a rampa de velocidade antes da redução de chaves.
+
+    A densidade das amostras vem do passo angular no pico de velocidade do
+    perfil (o WHIP chega a 3x a média), não só da quantidade de frames.
+    Retorna (progressos, valores).
+    """
+    def progress(t):
+        return rotation_profile(remap(t) if remap else t, profile)
+
+    q_start = rotation_to_quaternion(start_value, rotation_mode)
+    peak_step = abs(angle) * peak_rate(progress)
+    count = max(2, math.ceil(frame_count * ROTATION_SUBSAMPLES),
+                math.ceil(peak_step / (ROTATION_MAX_STEP * tolerance))) + 1
+    times = [i / (count - 1) for i in range(count)]
+
+    quats = []
+    values = []
+    prev = tuple(start_value)
+    for t in times:
+        step = Quaternion(axis, angle * progress(t))
+        q = q_start @ step if local else step @ q_start
+        quats.append(q)
+
+        if rotation_mode == 'QUATERNION':
+            if q.dot(Quaternion(prev)) < 0:
+                q = -q
+            value = tuple(q)
+        else:
+            value = tuple(q.to_euler(rotation_mode, Euler(prev, rotation_mode)))
+        values.append(value)
+        prev = value
+
+    # Douglas-Peucker com erro angular: divide onde a interpolação mais se afasta
+    keep = {0, count - 1}
+    stack = [(0, count - 1)]
+    while stack:
+        i, j = stack.pop()
+        worst, worst_k = 0.0, None
+        span = times[j] - times[i]
+        for k in range(i + 1, j):
+            f = (times[k] - times[i]) / span
+            interp = [a + (b - a) * f for a, b in zip(values[i], values[j])]
+            error = angle_between(quats[k], rotation_to_quaternion(interp, rotation_mode))
+            if error > worst:
+                worst, worst_k = error, k
+        if worst > tolerance:
+            keep.add(worst_k)
+            stack.append((i, worst_k))
+            stack.append((worst_k, j))
+
+    indices = sorted(keep)
+    return [times[i] for i in indices], [values[i] for i in indices]
+
+
+def write_keyframes(id_data, data_path, frames, values, interpolation='LINEAR', indices=None):
+    """Grava todas as chaves de `data_path` de uma vez, substituindo as do intervalo.
+
+    `indices` diz a qual componente cada coluna de `values` pertence (padrão 0, 1, 2...).
+    """
+    id_data.keyframe_insert(data_path=data_path, frame=frames[0])
+    action = id_data.animation_data.action
+    first, last = frames[0], frames[-1]
+
+    if indices is None:
+        indices = range(len(values[0]))
+
+    for column, index in enumerate(indices):
+        fcurve = action.fcurves.find(data_path, index=index)
+        if fcurve is None:
+            continue
+
+        points = fcurve.keyframe_points
+        for point in reversed(list(points)):
+            if first <= point.co.x <= last:
+                points.remove(point, fast=True)
+
+        offset = len(points)
+        co = [0.0] * (2 * offset)
+        points.foreach_get("co", co)
+        for frame, value in zip(frames, values):
+            co.extend((frame, value[column]))
+
+        points.add(len(frames))
+        points.foreach_set("co", co)
+        for point in points[offset:]:
+            point.interpolation = interpolation
+        fcurve.update()
+
+
+def key_path(camera, path, target_obj, target_loc, start_frame, end_frame, props, steps=1):
+    """Grava `steps + 1` chaves de localização tiradas da função de trajetória `path`."""
+    progress = [i / steps for i in range(steps + 1)]
+    positions = path(camera, target_obj, target_loc, progress, props)
+    frames = [start_frame + (end_frame - start_frame) * p for p in progress]
+    write_keyframes(camera, "location", frames, positions.tolist())
+
+
+def key_rotation(camera, axis, angle, local, start_frame, end_frame, profile, tolerance,
+                 start_rotation=None, remap=None):
+    """Grava a rotação amostrada; `start_rotation` (quaternion) substitui a orientação inicial."""
+    if camera.rotation_mode == 'AXIS_ANGLE':
+        camera.rotation_mode = 'XYZ'
+    rotation_mode = camera.rotation_mode
+
+    if start_rotation is not None:
+        if rotation_mode == 'QUATERNION':
+            camera.rotation_quaternion = start_rotation
+        else:
+            camera.rotation_euler = start_rotation.to_euler(rotation_mode, camera.rotation_euler)
+
+    if rotation_mode == 'QUATERNION':
+        data_path = "rotation_quaternion"
+        start_value = tuple(camera.rotation_quaternion.normalized())
+    else:
+        data_path = "rotation_euler"
+        start_value = tuple(camera.rotation_euler)
+
+    times, values = sample_rotation(
+        start_value, axis, angle, local, rotation_mode,
+        end_frame - start_frame,
+        profile,
+        tolerance,
+        remap,
+    )
+    frames = [start_frame + (end_frame - start_frame) * t for t in times]
+    write_keyframes(camera, data_path, frames, values)
+    return data_path
+
+
+def remove_lens_driver(cam_data):
+    """Remove o driver de lente do Dolly Zoom; drivers do usuário ficam intactos."""
+    anim = cam_data.animation_data
+    if not anim:
+        return
+    for fcurve in anim.drivers:
+        if fcurve.data_path == "lens" and fcurve.driver.variables.get(LENS_DRIVER_VAR):
+            anim.drivers.remove(fcurve)
+            return
+
+
+def remove_track_constraint(camera):
+    for c in list(camera.constraints):
+        if c.name == TRACK_CONSTRAINT:
+            camera.constraints.remove(c)
+
+
+def track_influence_fcurve(camera):
+    constraint = camera.constraints.get(TRACK_CONSTRAINT)
+    anim = camera.animation_data
+    if constraint is None or not (anim and anim.action):
+        return None
+    return anim.action.fcurves.find(constraint.path_from_id("influence"))
+
+
+def key_track_influence(camera, frame, influence):
+    """Chave CONSTANT na influência do QCM_Track."""
+    constraint = camera.constraints[TRACK_CONSTRAINT]
+    constraint.influence = influence
+    constraint.keyframe_insert(data_path="influence", frame=frame)
+
+    for point in track_influence_fcurve(camera).keyframe_points:
+        point.interpolation = 'CONSTANT'
+
+
+def suspend_track_constraint(camera, start_frame, end_frame):
+    """Desliga o QCM_Track só entre `start_frame` e `end_frame`.
+
+    O constraint é compartilhado com os movimentos anteriores da câmera, então
+    a influência é animada em vez de remover o constraint.
+    """
+    constraint = camera.constraints.get(TRACK_CONSTRAINT)
+    if constraint is None:
+        return
+
+    fcurve = track_influence_fcurve(camera)
+    restore_frame = end_frame + 1
+    if fcurve is None:
+        before = after = constraint.influence
+    else:
+        before = fcurve.evaluate(start_frame - 1)
+        after = fcurve.evaluate(restore_frame)
+
+        points = fcurve.keyframe_points
+        for point in reversed(list(points)):
+            if start_frame <= point.co.x <= restore_frame:
+                points.remove(point, fast=True)
+        fcurve.update()
+
+    # Sem chave antes do intervalo, a extrapolação levaria o 0 para os frames anteriores
+    if fcurve is None or not any(p.co.x < start_frame for p in fcurve.keyframe_points):
+        key_track_influence(camera, start_frame - 1, before)
+
+    key_track_influence(camera, start_frame, 0.0)
+    key_track_influence(camera, restore_frame, after)
+
+
+def track_rotation(camera):
+    """Orientação avaliada da câmera (com o QCM_Track) no espaço do parent."""
+    matrix = camera.matrix_world
+    if camera.parent:
+        matrix = (camera.parent.matrix_world @ camera.matrix_parent_inverse).inverted() @ matrix
+    return matrix.decompose()[1]
+
+
+def add_track_constraint(camera, target_obj=None, target_loc=None, start_frame=None):
+    """Cria o QCM_Track; se a influência já foi animada, religa a partir de `start_frame`."""
+    remove_track_constraint(camera)
+    empty = None
+
+    if target_obj:
+        constraint = camera.constraints.new('TRACK_TO')
+        constraint.name = "QCM_Track"
+        constraint.target = target_obj
+        constraint.track_axis = 'TRACK_NEGATIVE_Z'
+        constraint.up_axis = 'UP_Y'
+    elif target_loc:
+        bpy.ops.object.empty_add(location=target_loc)
+        empty = bpy.context.active_object
+        empty.name = "QCM_Target"
+        empty.hide_viewport = True
+
+        constraint = camera.constraints.new('TRACK_TO')
+        constraint.name = "QCM_Track"
+        constraint.target = empty
+        constraint.track_axis = 'TRACK_NEGATIVE_Z'
+        constraint.up_axis = 'UP_Y'
+    else:
+        return None
+
+    # Recriado com o mesmo nome, o constraint herda a curva de influência antiga
+    if start_frame is not None and track_influence_fcurve(camera) is not None:
+        key_track_influence(camera, start_frame, 1.0)
+
+    return empty
+
+
+def remove_qcm_objects():
+    for obj in list(bpy.data.objects):
+        if obj.name.startswith("QCM_"):
+            bpy.data.objects.remove(obj, do_unlink=True)